@@ -7,6 +7,7 @@
 from __future__ import annotations
 
 from collections.abc import Iterable
+from typing import Any
 
 import torch
 from torch import Tensor
@@ -50,12 +51,27 @@ class Mean(MeanBase):
     """See :class:`MeanBase`."""
 
     @override
+    @torch.inference_mode()
     def update(
         self,
         input_: int | float | Tensor,
         *,
         weight: int | float | Tensor = 1.0,
     ) -> Self:
+        # Fast path; accumulate in-place on device and avoid constructing
+        # tensors for plain scalars.
+        if isinstance(weight, (int, float)):
+            if isinstance(input_, Tensor):
+                self.weighted_sum.add_(input_.sum(), alpha=weight)
+
+                self.weights += input_.numel() * weight
+            else:
+                self.weighted_sum += input_ * weight
+
+                self.weights += weight
+
+            return self
+
         if isinstance(input_, (int, float)):
             input_ = torch.tensor(input_)
 
@@ -65,15 +81,38 @@ class Mean(MeanBase):
 
 
 class Sum(SumBase):
-    """See :class:`SumBase`."""
+    """See :class:`SumBase`.
+
+    Scalar updates are accumulated on the host and flushed to the metric state
+    only when the state is read (e.g. in :meth:`compute` or :meth:`state_dict`).
+    This way counters updated in every step do not launch any device kernels.
+    """
+
+    _pending: int | float
+
+    def __init__(self, *, device: Device | None = None) -> None:
+        self._pending = 0
+
+        super().__init__(device=device)
 
     @override
+    @torch.inference_mode()
     def update(
         self,
         input_: int | float | Tensor,
         *,
         weight: int | float | Tensor = 1.0,
     ) -> Self:
+        # Fast path; accumulate in-place and avoid constructing tensors for
+        # plain scalars.
+        if isinstance(weight, (int, float)):
+            if isinstance(input_, Tensor):
+                self.weighted_sum.add_(input_.sum(), alpha=weight)
+            else:
+                self._pending += input_ * weight
+
+            return self
+
         if isinstance(input_, (int, float)):
             input_ = torch.tensor(input_)
 
@@ -81,14 +120,77 @@ class Sum(SumBase):
 
         return self
 
+    @override
+    @torch.inference_mode()
+    def compute(self) -> Tensor:
+        self._flush()
+
+        return super().compute()
+
+    @override
+    @torch.inference_mode()
+    def merge_state(self, metrics: Iterable[SumBase]) -> Self:
+        self._flush()
+
+        metrics = list(metrics)
+
+        for metric in metrics:
+            if isinstance(metric, Sum):
+                metric._flush()
+
+        super().merge_state(metrics)
+
+        return self
+
+    @override
+    @torch.inference_mode()
+    def _prepare_for_merge_state(self) -> None:
+        self._flush()
+
+        super()._prepare_for_merge_state()
+
+    @override
+    def reset(self) -> Self:
+        self._pending = 0
+
+        super().reset()
+
+        return self
+
+    @override
+    def state_dict(self) -> dict[str, Any]:
+        self._flush()
+
+        return super().state_dict()
+
+    @override
+    def load_state_dict(self, state_dict: dict[str, Any], strict: bool = True) -> None:
+        self._pending = 0
+
+        super().load_state_dict(state_dict, strict)
+
+    @torch.inference_mode()
+    def _flush(self) -> None:
+        if self._pending != 0:
+            self.weighted_sum += self._pending
+
+            self._pending = 0
+
 
 class MaxSum(Metric[Tensor]):
     """Calculate the sum of all elements in all the input tensors locally and
-    take the maximum value when merged with other metrics."""
+    take the maximum value when merged with other metrics.
+
+    Like :class:`Sum`, scalar updates are accumulated on the host and flushed
+    to the metric state only when the state is read.
+    """
 
     sum_: Tensor
+    _pending: int
 
     def __init__(self, *, device: Device | None = None) -> None:
+        self._pending = 0
+
         super().__init__(device=device)
 
         sum_ = torch.zeros((), device=device, dtype=torch.int64)
@@ -98,19 +200,60 @@ class MaxSum(Metric[Tensor]):
     @override
     @torch.inference_mode()
     def update(self, input_: int | Tensor) -> Self:
-        self.sum_ += input_
+        if isinstance(input_, int):
+            self._pending += input_
+        else:
+            self.sum_ += input_
 
         return self
 
     @override
     @torch.inference_mode()
     def compute(self) -> Tensor:
+        self._flush()
+
         return self.sum_
 
     @override
     @torch.inference_mode()
     def merge_state(self, metrics: Iterable[MaxSum]) -> Self:
+        self._flush()
+
         for metric in metrics:
+            metric._flush()
+
             self.sum_ = torch.max(self.sum_, metric.sum_.to(self.device))
 
         return self
+
+    @override
+    @torch.inference_mode()
+    def _prepare_for_merge_state(self) -> None:
+        self._flush()
+
+    @override
+    def reset(self) -> Self:
+        self._pending = 0
+
+        super().reset()
+
+        return self
+
+    @override
+    def state_dict(self) -> dict[str, Any]:
+        self._flush()
+
+        return super().state_dict()
+
+    @override
+    def load_state_dict(self, state_dict: dict[str, Any], strict: bool = True) -> None:
+        self._pending = 0
+
+        super().load_state_dict(state_dict, strict)
+
+    @torch.inference_mode()
+    def _flush(self) -> None:
+        if self._pending != 0:
+            self.sum_ += self._pending
+
+            self._pending = 0
@@ -7,7 +7,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, final
 
 from torch import Tensor
@@ -76,6 +76,15 @@ class Seq2SeqBatch:
     example: Any = None
     """The data example from which this batch was constructed."""
 
+    # Counting the elements requires a device-to-host sync; therefore, cache
+    # them since they are queried multiple times per step.
+    _num_source_elements: int | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _num_target_elements: int | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     @property
     def batch_size(self) -> int:
         """The size of the batch dimension."""
@@ -83,17 +92,23 @@ class Seq2SeqBatch:
 
     def num_source_elements(self) -> int:
         """Return the number of source elements in the batch."""
-        if self.source_padding_mask is None:
-            return self.source_seqs.numel()
+        if self._num_source_elements is None:
+            if self.source_padding_mask is None:
+                self._num_source_elements = self.source_seqs.numel()
+            else:
+                self._num_source_elements = int(self.source_padding_mask.seq_lens.sum())
 
-        return int(self.source_padding_mask.seq_lens.sum())
+        return self._num_source_elements
 
     def num_target_elements(self) -> int:
         """Return the number of target elements in the batch."""
-        if self.target_padding_mask is None:
-            return self.target_seqs.numel()
+        if self._num_target_elements is None:
+            if self.target_padding_mask is None:
+                self._num_target_elements = self.target_seqs.numel()
+            else:
+                self._num_target_elements = int(self.target_padding_mask.seq_lens.sum())
 
-        return int(self.target_padding_mask.seq_lens.sum())
+        return self._num_target_elements
 
 
 def as_auto_regressive_input(batch: Seq2SeqBatch) -> tuple[Seq2SeqBatch, SequenceBatch]:
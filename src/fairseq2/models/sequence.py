@@ -7,7 +7,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, final
 
 import torch
@@ -68,6 +68,15 @@ class SequenceBatch:
     example: Any = None
     """The data example from which this batch was constructed."""
 
+    # Counting the elements requires a device-to-host sync; therefore, cache
+    # them since they are queried multiple times per step.
+    _num_elements: int | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _num_target_elements: int | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     @property
     def batch_size(self) -> int:
         """The size of the batch dimension."""
@@ -75,17 +84,23 @@ class SequenceBatch:
 
     def num_elements(self) -> int:
         """Return the number of elements in the batch."""
-        if self.padding_mask is None:
-            return self.seqs.numel()
+        if self._num_elements is None:
+            if self.padding_mask is None:
+                self._num_elements = self.seqs.numel()
+            else:
+                self._num_elements = int(self.padding_mask.seq_lens.sum())
 
-        return int(self.padding_mask.seq_lens.sum())
+        return self._num_elements
 
     def num_target_elements(self) -> int:
         """Return the number of target elements in the batch."""
-        if self.target_mask is not None:
-            return int(self.target_mask.sum())
+        if self._num_target_elements is None:
+            if self.target_mask is not None:
+                self._num_target_elements = int(self.target_mask.sum())
+            else:
+                self._num_target_elements = self.num_elements()
 
-        return self.num_elements()
+        return self._num_target_elements
 
 
 def as_auto_regressive_input(
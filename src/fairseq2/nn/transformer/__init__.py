@@ -65,10 +65,14 @@ from fairseq2.nn.transformer.encoder_layer import (
     TransformerEncoderLayer as TransformerEncoderLayer,
 )
 from fairseq2.nn.transformer.ffn import FeedForwardNetwork as FeedForwardNetwork
+from fairseq2.nn.transformer.ffn import (
+    FusedGLUFeedForwardNetwork as FusedGLUFeedForwardNetwork,
+)
 from fairseq2.nn.transformer.ffn import GLUFeedForwardNetwork as GLUFeedForwardNetwork
 from fairseq2.nn.transformer.ffn import (
     StandardFeedForwardNetwork as StandardFeedForwardNetwork,
 )
+from fairseq2.nn.transformer.ffn import compile_ffn as compile_ffn
 from fairseq2.nn.transformer.layer_norm import LayerNormFactory as LayerNormFactory
 from fairseq2.nn.transformer.layer_norm import (
     create_standard_layer_norm as create_standard_layer_norm,
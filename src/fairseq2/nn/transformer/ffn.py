@@ -8,10 +8,11 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from collections.abc import Callable
-from typing import final
+from typing import Any, final
 
+import torch
 from torch import Tensor
-from torch.nn import Dropout, Module, ReLU, SiLU
+from torch.nn import GELU, Dropout, Module, ReLU, SiLU
 from typing_extensions import override
 
 from fairseq2.nn.normalization import LayerNorm
@@ -22,6 +23,7 @@ from fairseq2.nn.transformer.layer_norm import (
 )
 from fairseq2.nn.transformer.norm_order import TransformerNormOrder
 from fairseq2.typing import DataType, Device
+from fairseq2.utils.version import torch_greater_or_equal
 
 
 class FeedForwardNetwork(Module, ABC):
@@ -65,6 +67,7 @@ class StandardFeedForwardNetwork(FeedForwardNetwork):
     inner_dropout: Dropout | None
     inner_norm: LayerNorm | None
     output_proj: Projection
+    fuse_inner_activation: bool
 
     def __init__(
         self,
@@ -77,6 +80,8 @@ class StandardFeedForwardNetwork(FeedForwardNetwork):
         norm_order: TransformerNormOrder = TransformerNormOrder.POST,
         layer_norm_factory: LayerNormFactory | None = None,
         proj_init_fn: Callable[[Linear], None] | None = None,
+        fuse_inner_activation: bool = False,
+        torch_compile: bool = False,
         device: Device | None = None,
         dtype: DataType | None = None,
     ) -> None:
@@ -90,7 +95,7 @@ class StandardFeedForwardNetwork(FeedForwardNetwork):
             bias.
         :param inner_activation:
             The activation to apply to outputs of the inner projection layer. If
-            ``None``, :func:`~torch.nn.ReLU` will be used.
+            ``None``, an in-place :func:`~torch.nn.ReLU` will be used.
         :param inner_dropout_p:
             The dropout probability on outputs of the inner projection layer.
         :param norm_order:
@@ -99,6 +104,17 @@ class StandardFeedForwardNetwork(FeedForwardNetwork):
             The factory to construct the Layer Normalization module.
         :param proj_init_fn:
             The callable to initialize the inner and output projections.
+        :param fuse_inner_activation:
+            If ``True``, when gradients are disabled, applies the bias and the
+            activation of the inner projection in the epilogue of its matrix
+            multiplication (i.e. via cuBLASLt on CUDA). Only used if the inner
+            projection is a :class:`Linear` with a bias and the activation is
+            :class:`~torch.nn.ReLU` or, on CUDA, a tanh-approximated
+            :class:`~torch.nn.GELU`. Note that the forward hooks of the inner
+            projection and activation modules won't be called on this path.
+        :param torch_compile:
+            If ``True``, applies :func:`torch.compile` to :meth:`forward`. See
+            :func:`compile_ffn` for details. (experimental)
         """
         super().__init__(model_dim)
 
@@ -110,7 +126,9 @@ class StandardFeedForwardNetwork(FeedForwardNetwork):
         )
 
         if inner_activation is None:
-            self.inner_activation = ReLU()
+            # The output of the inner projection is not needed for its
+            # backward pass; therefore, it is safe to overwrite in-place.
+            self.inner_activation = ReLU(inplace=True)
         else:
             self.inner_activation = inner_activation
 
@@ -130,18 +148,123 @@ class StandardFeedForwardNetwork(FeedForwardNetwork):
             inner_dim, model_dim, bias, init_fn=proj_init_fn, device=device, dtype=dtype
         )
 
+        self.fuse_inner_activation = fuse_inner_activation
+
+        if torch_compile:
+            compile_ffn(self)
+
     @override
     def forward(self, seqs: Tensor) -> Tensor:
-        seqs = self.inner_proj(seqs)
+        seqs = self.forward_inner(seqs)
 
-        seqs = self.inner_activation(seqs)
+        seqs = self.forward_outer(seqs)
 
-        if self.inner_layer_norm is not None:
-            seqs = self.inner_layer_norm(seqs)
+        return seqs
 
-        if self.inner_dropout is not None:
-            seqs = self.inner_dropout(seqs)
+    def forward_inner(self, seqs: Tensor) -> Tensor:
+        """Apply the inner projection along with its activation, Layer
+        Normalization, and dropout.
+
+        :param seqs:
+            The sequences to project. *Shape:* :math:`(N,S,M)`, where :math:`N`
+            is the batch size, :math:`S` is the sequence length, and :math:`M`
+            is the dimensionality of the model.
+
+        :returns:
+            The inner sequences. *Shape:* :math:`(N,S,H)`, where :math:`N` is
+            the batch size, :math:`S` is the sequence length, and :math:`H` is
+            the dimensionality of the inner projection layer.
+        """
+        # Submodule lookups go through `Module.__getattr__`; do them once.
+        inner_layer_norm = self.inner_layer_norm
+        inner_dropout = self.inner_dropout
+
+        if self.fuse_inner_activation:
+            fused_seqs = self._maybe_fused_inner_proj(seqs)
+        else:
+            fused_seqs = None
+
+        if fused_seqs is None:
+            seqs = self.inner_proj(seqs)
+
+            seqs = self.inner_activation(seqs)
+        else:
+            seqs = fused_seqs
+
+        if inner_layer_norm is not None:
+            seqs = inner_layer_norm(seqs)
+
+        # Dropout is a no-op in eval mode; skip the module call altogether.
+        if inner_dropout is not None and self.training:
+            seqs = inner_dropout(seqs)
+
+        return seqs
+
+    def _maybe_fused_inner_proj(self, seqs: Tensor) -> Tensor | None:
+        # During inference, apply the bias and the activation in the epilogue
+        # of the inner projection matrix multiplication (i.e. via cuBLASLt on
+        # CUDA) to avoid an extra round-trip of the inner activations through
+        # the device memory.
+        if torch.is_grad_enabled():
+            return None
+
+        device_type = seqs.device.type
+
+        if device_type != "cuda" and device_type != "cpu":
+            return None
+
+        if torch_greater_or_equal(2, 4):
+            autocast = torch.is_autocast_enabled(device_type)
+        elif device_type == "cuda":
+            autocast = torch.is_autocast_enabled()
+        else:
+            autocast = torch.is_autocast_cpu_enabled()
+
+        if autocast:
+            return None
+
+        proj = self.inner_proj
+
+        if type(proj) is not Linear or proj.bias is None:
+            return None
+
+        if seqs.dtype != proj.weight.dtype:
+            return None
+
+        activation = self.inner_activation
+
+        if type(activation) is ReLU:
+            use_gelu = False
+        elif type(activation) is GELU and activation.approximate == "tanh":
+            # Only the CUDA implementation uses the tanh approximation; on CPU,
+            # `_addmm_activation` computes the exact GELU.
+            if not seqs.is_cuda:
+                return None
+
+            use_gelu = True
+        else:
+            return None
+
+        x = seqs.reshape(-1, seqs.size(-1))
+
+        x = torch._addmm_activation(proj.bias, x, proj.weight.t(), use_gelu=use_gelu)
+
+        return x.view(*seqs.shape[:-1], proj.output_dim)
 
+    def forward_outer(self, seqs: Tensor) -> Tensor:
+        """Apply the output projection.
+
+        :param seqs:
+            The inner sequences returned by :meth:`forward_inner`. *Shape:*
+            :math:`(N,S,H)`, where :math:`N` is the batch size, :math:`S` is the
+            sequence length, and :math:`H` is the dimensionality of the inner
+            projection layer.
+
+        :returns:
+            The projected sequences. *Shape:* :math:`(N,S,M)`, where :math:`N`
+            is the batch size, :math:`S` is the sequence length, and :math:`M`
+            is the dimensionality of the model.
+        """
         seqs = self.output_proj(seqs)
 
         return seqs
@@ -250,3 +373,181 @@ class GLUFeedForwardNetwork(FeedForwardNetwork):
             f"inner_dim_scale={self.inner_dim_scale:G}, "
             f"inner_dim_to_multiple={self.inner_dim_to_multiple}"
         )
+
+
+@final
+class FusedGLUFeedForwardNetwork(FeedForwardNetwork):
+    """Represents a GLU-based Transformer feed-forward network as described in
+    :cite:t:`https://doi.org/10.48550/arxiv.2002.05202`
+
+    As opposed to :class:`GLUFeedForwardNetwork`, the gate and inner projections
+    are fused into a single projection so that the input is read only once by a
+    single matrix multiplication. Checkpoints of :class:`GLUFeedForwardNetwork`
+    can be loaded as is; their gate and inner projection weights get
+    concatenated on the fly.
+    """
+
+    gate_inner_proj: Projection
+    gate_activation: Module
+    inner_dim_scale: float
+    inner_dim_to_multiple: int
+    inner_dropout: Dropout | None
+    output_proj: Projection
+
+    def __init__(
+        self,
+        model_dim: int,
+        inner_dim: int,
+        bias: bool,
+        *,
+        gate_activation: Module | None = None,
+        inner_dim_scale: float = 2 / 3,
+        inner_dim_to_multiple: int = 1,
+        inner_dropout_p: float = 0.0,
+        device: Device | None = None,
+        dtype: DataType | None = None,
+    ) -> None:
+        """
+        :param model_dim:
+            The dimensionality of the model.
+        :param inner_dim:
+            The non-scaled dimensionality of the inner projection layer.
+        :param bias:
+            If ``True``, all projections learn an additive bias.
+        :param gate_activation:
+            The activation to apply to outputs of the gate projection. If
+            ``None``, :func:`~torch.nn.SiLU` will be used.
+        :param inner_dim_scale:
+            The scale factor for the dimensionality of the inner projection
+            layer.
+        :param inner_dim_to_multiple:
+            The dimensionality of the inner projection layer is rounded up to
+            the nearest multiple of this value.
+        :param inner_dropout_p:
+            The dropout probability on outputs of the inner projection layer.
+        """
+        super().__init__(model_dim)
+
+        self.inner_dim_scale = inner_dim_scale
+
+        if inner_dim_scale != 1.0:
+            inner_dim = int(inner_dim * inner_dim_scale)
+
+        self.inner_dim_to_multiple = inner_dim_to_multiple
+
+        if inner_dim_to_multiple != 1:
+            inner_dim = inner_dim_to_multiple * (
+                (inner_dim + inner_dim_to_multiple - 1) // inner_dim_to_multiple
+            )
+
+        self.gate_inner_proj = Linear(
+            model_dim, inner_dim * 2, bias, device=device, dtype=dtype
+        )
+
+        if gate_activation is None:
+            self.gate_activation = SiLU()
+        else:
+            self.gate_activation = gate_activation
+
+        if inner_dropout_p > 0.0:
+            self.inner_dropout = Dropout(inner_dropout_p)
+        else:
+            self.register_module("inner_dropout", None)
+
+        self.output_proj = Linear(
+            inner_dim, model_dim, bias, device=device, dtype=dtype
+        )
+
+    @override
+    def forward(self, seqs: Tensor) -> Tensor:
+        gate, seqs = self.gate_inner_proj(seqs).chunk(2, dim=-1)
+
+        gate = self.gate_activation(gate)
+
+        seqs = seqs * gate
+
+        if self.inner_dropout is not None:
+            seqs = self.inner_dropout(seqs)
+
+        seqs = self.output_proj(seqs)
+
+        return seqs
+
+    @override
+    def _load_from_state_dict(
+        self, state_dict: dict[str, Any], prefix: str, *args: Any, **kwargs: Any
+    ) -> None:
+        # Merge the gate and inner projections of a `GLUFeedForwardNetwork`
+        # checkpoint.
+        for name in ("weight", "bias"):
+            gate_key = f"{prefix}gate_proj.{name}"
+            inner_key = f"{prefix}inner_proj.{name}"
+
+            if gate_key in state_dict and inner_key in state_dict:
+                gate = state_dict.pop(gate_key)
+
+                inner = state_dict.pop(inner_key)
+
+                state_dict[f"{prefix}gate_inner_proj.{name}"] = torch.cat(
+                    [gate, inner], dim=0
+                )
+
+        super()._load_from_state_dict(state_dict, prefix, *args, **kwargs)
+
+    def extra_repr(self) -> str:
+        """:meta private:"""
+        s = super().extra_repr()
+
+        return (
+            f"{s}, "
+            f"inner_dim_scale={self.inner_dim_scale:G}, "
+            f"inner_dim_to_multiple={self.inner_dim_to_multiple}"
+        )
+
+
+def compile_ffn(
+    module: Module, *, dynamic: bool = True, mode: str | None = None
+) -> None:
+    """Apply :func:`torch.compile` to the ``forward`` method of each
+    :class:`FeedForwardNetwork` in ``module``.
+
+    As opposed to compiling ``module`` as a whole, the feed-forward networks are
+    compiled in-place; therefore the parameter names of ``module`` stay intact.
+    Compiling the network as a single graph lets the compiler fuse the inner
+    activation (and dropout) into the epilogue of the inner projection, which
+    avoids a round-trip of the inner activations through the device memory.
+
+    .. note::
+        The compiled ``forward`` is stored as an instance attribute of each
+        feed-forward network and refers to the original network. Therefore,
+        a :func:`copy.deepcopy` of ``module`` still runs the parameters of the
+        original networks, and ``module`` cannot be pickled (e.g. via
+        :func:`torch.save`) anymore. Call :func:`compile_ffn` after copying,
+        and save state dictionaries instead of modules.
+
+    :param module:
+        The module whose feed-forward networks to compile. Can be a feed-forward
+        network itself.
+    :param dynamic:
+        If ``True``, compiles the networks with dynamic shapes to avoid
+        recompilations on varying batch sizes and sequence lengths. The model
+        and inner dimensions are always specialized since they are fixed by the
+        shapes of the projection weights.
+    :param mode:
+        The compilation mode as accepted by :func:`torch.compile`. For instance,
+        'max-autotune' benchmarks and picks the best kernel configurations for
+        the projection shapes at the expense of a longer compilation. To reuse
+        compiled kernels across processes, enable the Inductor FX graph cache
+        (i.e. ``TORCHINDUCTOR_FX_GRAPH_CACHE=1``).
+    """
+    for m in module.modules():
+        if not isinstance(m, FeedForwardNetwork):
+            continue
+
+        # Already compiled.
+        if "forward" in m.__dict__:
+            continue
+
+        m.forward = torch.compile(  # type: ignore[method-assign]
+            m.forward, fullgraph=True, dynamic=dynamic, mode=mode
+        )
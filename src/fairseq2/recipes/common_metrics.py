@@ -342,12 +342,14 @@ class Seq2SeqGenerationMetricBag(TaskMetricBag):
 
 def set_throughput_value(metric_values: dict[str, Any], elapsed_time: float) -> None:
     """Set the throughput value in ``metric_values``."""
-    try:
-        num_elements = metric_values["num_elements"]
-    except KeyError:
-        return
+    num_elements = metric_values.get("num_elements")
+
+    # The value will be materialized on the host by the metric recorders
+    # anyway; read it once here instead of allocating a new device tensor.
+    if isinstance(num_elements, Tensor):
+        num_elements = num_elements.item()
 
-    if not isinstance(num_elements, (int, float, Tensor)):
+    if not isinstance(num_elements, (int, float)):
         return
 
     if elapsed_time == 0.0:
@@ -0,0 +1,64 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+# All rights reserved.
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+
+from __future__ import annotations
+
+import torch
+
+from fairseq2.models.seq2seq import Seq2SeqBatch
+from fairseq2.models.sequence import SequenceBatch
+from fairseq2.nn.padding import PaddingMask
+from tests.common import device
+
+
+class TestSequenceBatch:
+    def test_num_elements_are_cached(self) -> None:
+        seqs = torch.zeros((2, 4), device=device)
+
+        seq_lens = torch.tensor([4, 2], device=device)
+
+        target_mask = torch.tensor(
+            [[True, True, False, False], [True, False, False, False]], device=device
+        )
+
+        batch = SequenceBatch(seqs, PaddingMask(seq_lens, 4), target_mask)
+
+        assert batch.num_elements() == 6
+        assert batch.num_target_elements() == 3
+
+        # Counts must not be recomputed on subsequent calls.
+        seq_lens.zero_()
+
+        target_mask.zero_()
+
+        assert batch.num_elements() == 6
+        assert batch.num_target_elements() == 3
+
+
+class TestSeq2SeqBatch:
+    def test_num_elements_are_cached(self) -> None:
+        source_seqs = torch.zeros((2, 4), device=device)
+        target_seqs = torch.zeros((2, 3), device=device)
+
+        source_seq_lens = torch.tensor([4, 1], device=device)
+        target_seq_lens = torch.tensor([3, 2], device=device)
+
+        batch = Seq2SeqBatch(
+            source_seqs,
+            PaddingMask(source_seq_lens, 4),
+            target_seqs,
+            PaddingMask(target_seq_lens, 3),
+        )
+
+        assert batch.num_source_elements() == 5
+        assert batch.num_target_elements() == 5
+
+        # Counts must not be recomputed on subsequent calls.
+        source_seq_lens.zero_()
+        target_seq_lens.zero_()
+
+        assert batch.num_source_elements() == 5
+        assert batch.num_target_elements() == 5
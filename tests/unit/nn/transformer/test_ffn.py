@@ -0,0 +1,112 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+# All rights reserved.
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+
+from __future__ import annotations
+
+import pytest
+import torch
+from torch.nn import GELU, Module, ReLU
+
+from fairseq2.nn.transformer import (
+    FusedGLUFeedForwardNetwork,
+    GLUFeedForwardNetwork,
+    StandardFeedForwardNetwork,
+    TransformerNormOrder,
+    compile_ffn,
+)
+from tests.common import assert_close, device
+
+
+class TestFusedGLUFeedForwardNetwork:
+    @pytest.mark.parametrize("bias", [False, True])
+    def test_forward_works_with_glu_checkpoint(self, bias: bool) -> None:
+        ffn = GLUFeedForwardNetwork(16, 32, bias, device=device)
+
+        fused_ffn = FusedGLUFeedForwardNetwork(16, 32, bias, device=device)
+
+        fused_ffn.load_state_dict(ffn.state_dict())
+
+        seqs = torch.randn((2, 3, 16), device=device)
+
+        assert_close(fused_ffn(seqs), ffn(seqs))
+
+
+class TestStandardFeedForwardNetwork:
+    def test_forward_inner_and_outer_work(self) -> None:
+        ffn = StandardFeedForwardNetwork(
+            16,
+            32,
+            bias=True,
+            norm_order=TransformerNormOrder.PRE_WITH_NORMFORMER,
+            device=device,
+        )
+
+        seqs = torch.randn((2, 3, 16), device=device)
+
+        inner_seqs = ffn.forward_inner(seqs)
+
+        assert inner_seqs.shape == (2, 3, 32)
+
+        assert_close(ffn.forward_outer(inner_seqs), ffn(seqs))
+
+    # fmt: off
+    @pytest.mark.parametrize("inner_activation,batch_size",
+        [
+            (ReLU(),                   2),
+            (ReLU(),                   0),
+            (GELU(approximate="tanh"), 2),
+            (GELU(),                   2),
+        ],
+    )
+    # fmt: on
+    def test_forward_works_with_fused_inner_activation(
+        self, inner_activation: Module, batch_size: int
+    ) -> None:
+        ffn = StandardFeedForwardNetwork(
+            16,
+            32,
+            bias=True,
+            inner_activation=inner_activation,
+            fuse_inner_activation=True,
+            device=device,
+        )
+
+        seqs = torch.randn((batch_size, 3, 16), device=device)
+
+        expected_seqs = ffn(seqs)
+
+        with torch.inference_mode():
+            seqs = ffn(seqs)
+
+        assert_close(seqs, expected_seqs)
+
+
+class TestCompileFFN:
+    def test_compile_ffn_works(self) -> None:
+        ffn = StandardFeedForwardNetwork(16, 32, bias=True, device=device)
+
+        param_names = [name for name, _ in ffn.named_parameters()]
+
+        seqs = torch.randn((2, 3, 16), device=device)
+
+        expected_seqs = ffn(seqs)
+
+        compile_ffn(ffn)
+
+        assert [name for name, _ in ffn.named_parameters()] == param_names
+
+        assert_close(ffn(seqs), expected_seqs)
+
+    def test_compile_ffn_is_noop_when_already_compiled(self) -> None:
+        ffn = StandardFeedForwardNetwork(16, 32, bias=True, device=device)
+
+        compile_ffn(ffn)
+
+        forward = ffn.forward
+
+        compile_ffn(ffn)
+
+        assert ffn.forward is forward
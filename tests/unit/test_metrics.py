@@ -12,7 +12,10 @@ from torcheval.metrics import Mean, Sum
 
 from fairseq2.gang import FakeGang
 from fairseq2.metrics import MetricBag
-from tests.common import device
+from fairseq2.metrics.aggregation import MaxSum
+from fairseq2.metrics.aggregation import Mean as ScalarMean
+from fairseq2.metrics.aggregation import Sum as ScalarSum
+from tests.common import assert_close, device
 
 
 class TestMetricBag:
@@ -34,6 +37,25 @@ class TestMetricBag:
         assert bag.test1.device == device
         assert bag.test2.device == device
 
+    def test_rollback_updates_discards_pending_scalar_updates(self) -> None:
+        bag = MetricBag(gang=FakeGang(device=device))
+
+        bag.test1 = ScalarSum(device=device)
+        bag.test2 = MaxSum(device=device)
+
+        bag.test1.update(2)
+        bag.test2.update(1)
+
+        bag.begin_updates()
+
+        bag.test1.update(3)
+        bag.test2.update(1)
+
+        bag.rollback_updates()
+
+        assert bag.test1.compute().item() == 2.0
+        assert bag.test2.compute().item() == 1
+
     def test_getattr_raises_error_when_metric_is_missing(self) -> None:
         bag = MetricBag(gang=FakeGang(device=device))
 
@@ -75,3 +97,145 @@ class TestMetricBag:
             match=r"^`state_dict` must contain metrics \['test1', 'test2'\], but contains \['foo'\] instead\.$",
         ):
             bag.load_state_dict(state_dict)
+
+
+class TestSum:
+    def test_update_works_with_scalars(self) -> None:
+        metric1 = ScalarSum(device=device)
+        metric2 = Sum(device=device)
+
+        for value, weight in [(2, 1.0), (3.5, 2), (4, 0.5)]:
+            metric1.update(value, weight=weight)
+            metric2.update(torch.tensor(value, device=device), weight=weight)
+
+        assert_close(metric1.compute(), metric2.compute())
+
+    def test_update_works_with_tensors_and_scalar_weights(self) -> None:
+        metric1 = ScalarSum(device=device)
+        metric2 = Sum(device=device)
+
+        for weight in [1.0, 2, 0.5]:
+            value = torch.randn((4,), device=device)
+
+            metric1.update(value, weight=weight)
+            metric2.update(value, weight=weight)
+
+        assert_close(metric1.compute(), metric2.compute())
+
+    def test_state_dict_works_with_scalars(self) -> None:
+        metric = ScalarSum(device=device)
+
+        metric.update(2)
+        metric.update(3, weight=2)
+
+        state_dict = metric.state_dict()
+
+        assert state_dict["weighted_sum"].item() == 8.0
+
+        metric.reset()
+
+        metric.load_state_dict(state_dict)
+
+        metric.update(1)
+
+        assert metric.compute().item() == 9.0
+
+    def test_merge_state_works_with_scalars(self) -> None:
+        metric1 = ScalarSum(device=device)
+        metric2 = ScalarSum(device=device)
+
+        metric1.update(2)
+        metric2.update(3, weight=2)
+
+        metric1.merge_state([metric2])
+
+        assert metric1.compute().item() == 8.0
+
+    def test_prepare_for_merge_state_flushes_scalars(self) -> None:
+        metric = ScalarSum(device=device)
+
+        metric.update(2)
+
+        metric._prepare_for_merge_state()
+
+        assert metric.weighted_sum.item() == 2.0
+
+
+class TestMaxSum:
+    def test_update_works_with_ints(self) -> None:
+        metric = MaxSum(device=device)
+
+        metric.update(1)
+        metric.update(2)
+        metric.update(torch.tensor(3, device=device))
+
+        assert metric.compute().item() == 6
+
+    def test_merge_state_works_with_ints(self) -> None:
+        metric1 = MaxSum(device=device)
+        metric2 = MaxSum(device=device)
+
+        metric1.update(2)
+        metric2.update(3)
+
+        metric1.merge_state([metric2])
+
+        assert metric1.compute().item() == 3
+
+        metric2.update(4)
+
+        metric1.merge_state([metric2])
+
+        assert metric1.compute().item() == 7
+
+    def test_prepare_for_merge_state_flushes_ints(self) -> None:
+        metric = MaxSum(device=device)
+
+        metric.update(2)
+
+        metric._prepare_for_merge_state()
+
+        assert metric.sum_.item() == 2
+
+    def test_state_dict_works_with_ints(self) -> None:
+        metric = MaxSum(device=device)
+
+        metric.update(2)
+
+        state_dict = metric.state_dict()
+
+        assert state_dict["sum_"].item() == 2
+
+        metric.reset()
+
+        assert metric.compute().item() == 0
+
+        metric.load_state_dict(state_dict)
+
+        metric.update(1)
+
+        assert metric.compute().item() == 3
+
+
+class TestMean:
+    def test_update_works_with_scalars(self) -> None:
+        metric1 = ScalarMean(device=device)
+        metric2 = Mean(device=device)
+
+        for value, weight in [(2, 1.0), (3.5, 2), (4, 0.5)]:
+            metric1.update(value, weight=weight)
+            metric2.update(torch.tensor(value, device=device), weight=weight)
+
+        assert_close(metric1.compute(), metric2.compute())
+
+    def test_update_works_with_tensors_and_scalar_weights(self) -> None:
+        metric1 = ScalarMean(device=device)
+        metric2 = Mean(device=device)
+
+        for weight in [1.0, 2, 0.5]:
+            value = torch.randn((4,), device=device)
+
+            metric1.update(value, weight=weight)
+            metric2.update(value, weight=weight)
+
+        assert_close(metric1.compute(), metric2.compute())